@@ -1,11 +1,139 @@
 import json
-import math
 import re
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Tuple
 import os
 import platform
 
+# 系统类型在运行期间不会变化，只检查一次
+_IS_WINDOWS = platform.system() == "Windows"
+
+# 字幕块分隔（空行）
+_BLOCK_SPLIT_RE = re.compile(r"\n\s*\n")
+# 时间戳行
+_SRT_TIME_RE = re.compile(
+    r"(\d{2}):(\d{2}):(\d{1,2})[.,](\d{3})\s-->\s(\d{2}):(\d{2}):(\d{1,2})[.,](\d{3})"
+)
+_VTT_TIME_RE = re.compile(
+    r"(\d{2}):(\d{2}):(\d{2})\.(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})\.(\d{3})"
+)
+_VTT_TIME_RE2 = re.compile(r"(\d{2}):(\d{2})\.(\d{3})\s*-->\s*(\d{2}):(\d{2})\.(\d{3})")
+_YT_TIME_RE = re.compile(
+    r"(\d{2}):(\d{2}):(\d{2}\.\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}\.\d{3})"
+)
+_ASS_LINE_RE = re.compile(
+    r"Dialogue: \d+,(\d+:\d{2}:\d{2}\.\d{2}),(\d+:\d{2}:\d{2}\.\d{2}),(.*?),.*?,\d+,\d+,\d+,.*?,(.*?)$"
+)
+# 字级时间戳及标签
+_YT_WORD_RE = re.compile(r"<(\d{2}:\d{2}:\d{2}\.\d{3})>([^<]*)")
+_YT_TIMESTAMP_ROW_RE = re.compile(r"\n(.*?<c>.*?</c>.*)")
+_VTT_TS_TAG_RE = re.compile(r"<\d{2}:\d{2}:\d{2}\.\d{3}>")
+_VTT_C_RE = re.compile(r"</?c>")
+_ASS_BRACE_RE = re.compile(r"\{[^}]*\}")
+
+
+# 字词分割：按码位查表的字符分类，替代多分支正则，逐字符线性扫描
+# 以单词形式出现的语言(连续提取)，取值为可续接字符的类别位
+_LATIN = 1
+_CYRILLIC = 2
+_GREEK = 4
+_ARABIC = 8
+_HEBREW = 16
+_DIGIT = 32
+_THAI_MARK = 64
+_SINGLE = 128  # 以单字形式出现的语言(单字提取)
+_WORD_RANGES = [
+    # 按优先级从低到高排列，高优先级覆盖低优先级
+    ((0x1000, 0x109F), _SINGLE),  # 缅甸文
+    ((0x0E80, 0x0EFF), _SINGLE),  # 老挝文
+    ((0x0980, 0x09FF), _SINGLE),  # 孟加拉语
+    ((0x0900, 0x097F), _SINGLE),  # 天城文(印地语等)
+    ((0x0E00, 0x0E7F), _THAI_MARK),  # 泰文基字符，后续续接音标
+    ((0xAC00, 0xD7AF), _SINGLE),  # 韩文
+    ((0x30A0, 0x30FF), _SINGLE),  # 日文片假名
+    ((0x3040, 0x309F), _SINGLE),  # 日文平假名
+    ((0x4E00, 0x9FFF), _SINGLE),  # 中文
+    (None, _DIGIT),  # 数字(Unicode十进制数字)
+    ((0x0590, 0x05FF), _HEBREW),  # 希伯来语
+    ((0x0600, 0x06FF), _ARABIC),  # 阿拉伯语
+    ((0x0370, 0x03FF), _GREEK),  # 希腊语
+    ((0x0400, 0x04FF), _CYRILLIC),  # 西里尔字母(俄语等)
+    ((0x0041, 0x005A), _LATIN),  # 拉丁字母及其变体(英语、德语、法语等)
+    ((0x0061, 0x007A), _LATIN),
+    ((0x0027, 0x0027), _LATIN),
+    ((0x00C0, 0x017F), _LATIN),
+]
+_THAI_MARK_RANGES = [(0x0E30, 0x0E3A), (0x0E47, 0x0E4E)]  # 泰文音标
+
+
+def _build_word_tables() -> Tuple[bytes, bytes]:
+    """构建字词分割查找表
+
+    Returns:
+        (起始表, 类别表)：起始表给出以该字符开头的词可续接的类别位，
+        _SINGLE 表示单字成词，0 表示非有效字符；类别表给出该字符所属的类别位
+    """
+    token_start = bytearray(0x10000)
+    char_bits = bytearray(0x10000)
+    digits = [cp for cp in range(0x10000) if chr(cp).isdecimal()]
+    for char_range, flag in _WORD_RANGES:
+        if char_range is None:
+            for cp in digits:
+                token_start[cp] = flag
+                char_bits[cp] |= flag
+            continue
+        lo, hi = char_range
+        token_start[lo : hi + 1] = bytes([flag]) * (hi - lo + 1)
+        if flag != _SINGLE and flag != _THAI_MARK:
+            for cp in range(lo, hi + 1):
+                char_bits[cp] |= flag
+    for lo, hi in _THAI_MARK_RANGES:
+        for cp in range(lo, hi + 1):
+            char_bits[cp] |= _THAI_MARK
+    # 冻结为只读的 bytes，作为模块常量共享
+    return bytes(token_start), bytes(char_bits)
+
+
+_TOKEN_START, _CHAR_BITS = _build_word_tables()
+# 纯ASCII文本只可能出现英文单词和数字，直接交给正则引擎在C层一次扫描完成
+_ASCII_WORD_RE = re.compile(r"[a-zA-Z']+|[0-9]+")
+
+
+def _split_words(text: str) -> List[str]:
+    """将文本切分为字词列表(数字及各语言单词连续提取，中日韩等单字提取)"""
+    if text.isascii():
+        return _ASCII_WORD_RE.findall(text)
+
+    words = []
+    token_start = _TOKEN_START
+    char_bits = _CHAR_BITS
+    char_code = ord  # 局部变量别名，避免循环内查找内置函数
+    i = 0
+    n = len(text)
+    while i < n:
+        char = text[i]
+        try:
+            mask = token_start[char_code(char)]
+        except IndexError:  # 基本多文种平面之外只识别数字
+            mask = _DIGIT if char.isdecimal() else 0
+        j = i + 1
+        if mask:
+            if mask != _SINGLE:
+                while j < n:
+                    char = text[j]
+                    try:
+                        bits = char_bits[char_code(char)]
+                    except IndexError:
+                        bits = _DIGIT if char.isdecimal() else 0
+                    if not bits & mask:
+                        break
+                    j += 1
+            words.append(text[i:j])
+        i = j
+    return words
+
 
 def handle_long_path(path: str) -> str:
     """处理Windows系统中的长路径问题
@@ -16,17 +144,17 @@ def handle_long_path(path: str) -> str:
     Returns:
         处理后的路径
     """
-    # 检查是否是Windows系统
-    if platform.system() == "Windows":
-        # 如果路径长度超过260个字符，添加\\?\前缀
-        if len(path) > 260 and not path.startswith("\\\\?\\"):
-            # 转换为绝对路径
-            abs_path = os.path.abspath(path)
-            return f"\\\\?\\{abs_path}"
+    # 非Windows系统直接返回；如果路径长度超过260个字符，添加\\?\前缀
+    if _IS_WINDOWS and len(path) > 260 and not path.startswith("\\\\?\\"):
+        # 转换为绝对路径
+        abs_path = os.path.abspath(path)
+        return f"\\\\?\\{abs_path}"
     return path
 
 
 class ASRDataSeg:
+    __slots__ = ("text", "translated_text", "start_time", "end_time")
+
     def __init__(
         self, text: str, start_time: int, end_time: int, translated_text: str = ""
     ):
@@ -55,19 +183,18 @@ class ASRDataSeg:
     @staticmethod
     def _ms_to_srt_time(ms: int) -> str:
         """Convert milliseconds to SRT time format (HH:MM:SS,mmm)"""
-        total_seconds, milliseconds = divmod(ms, 1000)
-        minutes, seconds = divmod(total_seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        return f"{int(hours):02}:{int(minutes):02}:{int(seconds):02},{int(milliseconds):03}"
+        hours, rest = divmod(int(ms), 3600000)
+        minutes, rest = divmod(rest, 60000)
+        seconds, milliseconds = divmod(rest, 1000)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
 
     @staticmethod
     def _ms_to_ass_ts(ms: int) -> str:
         """Convert milliseconds to ASS timestamp format (H:MM:SS.cc)"""
-        total_seconds, milliseconds = divmod(ms, 1000)
-        minutes, seconds = divmod(total_seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        centiseconds = int(milliseconds / 10)
-        return f"{int(hours):01}:{int(minutes):02}:{int(seconds):02}.{centiseconds:02}"
+        hours, rest = divmod(int(ms), 3600000)
+        minutes, rest = divmod(rest, 60000)
+        seconds, milliseconds = divmod(rest, 1000)
+        return f"{hours:01d}:{minutes:02d}:{seconds:02d}.{milliseconds // 10:02d}"
 
     @property
     def transcript(self) -> str:
@@ -81,8 +208,10 @@ class ASRDataSeg:
 class ASRData:
     def __init__(self, segments: List[ASRDataSeg]):
         # 去除 segments.text 为空的
-        filtered_segments = [seg for seg in segments if seg.text and seg.text.strip()]
-        filtered_segments.sort(key=lambda x: x.start_time)
+        filtered_segments = [
+            seg for seg in segments if seg.text and not seg.text.isspace()
+        ]
+        filtered_segments.sort(key=attrgetter("start_time"))
         self.segments = filtered_segments
 
     def __iter__(self):
@@ -111,8 +240,8 @@ class ASRData:
 
         for seg in self.segments:
             text = seg.text.strip()
-            # 检查是否只包含一个英文单词或一个汉字
-            if (len(text.split()) == 1 and text.isascii()) or len(text.strip()) <= 2:
+            # 检查是否只包含一个英文单词或一个汉字(先做开销小的判断)
+            if len(text) <= 2 or (text.isascii() and len(text.split()) == 1):
                 valid_segments += 1
         return (valid_segments / total_segments) >= 0.8
 
@@ -126,58 +255,32 @@ class ASRData:
         """
         CHARS_PER_PHONEME = 4  # 每个音素包含的字符数
         new_segments = []
+        append = new_segments.append
 
         for seg in self.segments:
             text = seg.text
             duration = seg.end_time - seg.start_time
 
-            # 匹配所有有效字符（包括数字和各种语言）
-            pattern = (
-                # 以单词形式出现的语言(连续提取)
-                r"[a-zA-Z\u00c0-\u00ff\u0100-\u017f']+"  # 拉丁字母及其变体(英语、德语、法语等)
-                r"|[\u0400-\u04ff]+"  # 西里尔字母(俄语等)
-                r"|[\u0370-\u03ff]+"  # 希腊语
-                r"|[\u0600-\u06ff]+"  # 阿拉伯语
-                r"|[\u0590-\u05ff]+"  # 希伯来语
-                r"|\d+"  # 数字
-                # 以单字形式出现的语言(单字提取)
-                r"|[\u4e00-\u9fff]"  # 中文
-                r"|[\u3040-\u309f]"  # 日文平假名
-                r"|[\u30a0-\u30ff]"  # 日文片假名
-                r"|[\uac00-\ud7af]"  # 韩文
-                r"|[\u0e00-\u0e7f][\u0e30-\u0e3a\u0e47-\u0e4e]*"  # 泰文基字符及其音标组合
-                r"|[\u0900-\u097f]"  # 天城文(印地语等)
-                r"|[\u0980-\u09ff]"  # 孟加拉语
-                r"|[\u0e80-\u0eff]"  # 老挝文
-                r"|[\u1000-\u109f]"  # 缅甸文
-            )
-            words = re.finditer(pattern, text)
-            words_list = list(words)
+            words_list = _split_words(text)
 
             if not words_list:
                 continue
 
-            # 计算总音素数
-            total_phonemes = sum(
-                math.ceil(len(w.group()) / CHARS_PER_PHONEME) for w in words_list
-            )
-            time_per_phoneme = duration / max(total_phonemes, 1)  # 防止除零
+            # 计算每个词及总音素数，并一次性换算出每个词的时长
+            # 整数向上取整，避免浮点除法和 math.ceil 调用
+            word_phonemes = [
+                (len(word) + CHARS_PER_PHONEME - 1) // CHARS_PER_PHONEME
+                for word in words_list
+            ]
+            time_per_phoneme = duration / max(sum(word_phonemes), 1)  # 防止除零
+            word_durations = [int(time_per_phoneme * p) for p in word_phonemes]
 
+            # 创建新的字词级segment
             current_time = seg.start_time
-            for word_match in words_list:
-                word = word_match.group()
-                # 计算当前词的音素数
-                word_phonemes = math.ceil(len(word) / CHARS_PER_PHONEME)
-                word_duration = int(time_per_phoneme * word_phonemes)
-
-                # 创建新的字词级segment
-                word_end_time = min(current_time + word_duration, seg.end_time)
-                new_segments.append(
-                    ASRDataSeg(
-                        text=word, start_time=current_time, end_time=word_end_time
-                    )
-                )
-
+            end_time = seg.end_time
+            for word, word_duration in zip(words_list, word_durations):
+                word_end_time = min(current_time + word_duration, end_time)
+                append(ASRDataSeg(word, current_time, word_end_time))
                 current_time = word_end_time
 
         self.segments = new_segments
@@ -187,13 +290,9 @@ class ASRData:
         """
         移除字幕中的标点符号(中文逗号、句号)
         """
-        punctuation = r"[，。]"
         for seg in self.segments:
-
-            seg.text = re.sub(f"{punctuation}+$", "", seg.text.strip())
-            seg.translated_text = re.sub(
-                f"{punctuation}+$", "", seg.translated_text.strip()
-            )
+            seg.text = seg.text.strip().rstrip("，。")
+            seg.translated_text = seg.translated_text.strip().rstrip("，。")
         return self
 
     def save(
@@ -219,62 +318,57 @@ class ASRData:
             self.to_txt(save_path=save_path, layout=layout)
         elif save_path.endswith(".json"):
             with open(save_path, "w", encoding="utf-8") as f:
-                json.dump(self.to_json(), f, ensure_ascii=False)
+                f.write(json.dumps(self.to_json(), ensure_ascii=False))
         elif save_path.endswith(".ass"):
             self.to_ass(save_path=save_path, style_str=ass_style, layout=layout)
         else:
             raise ValueError(f"Unsupported file extension: {save_path}")
 
+    def _layout_texts(self, layout: str) -> List[str]:
+        """按字幕布局生成每个segment的显示文本(布局只判断一次)"""
+        segments = self.segments
+        if layout == "原文在上":
+            return [
+                (
+                    f"{seg.text}\n{seg.translated_text}"
+                    if seg.translated_text
+                    else seg.text
+                )
+                for seg in segments
+            ]
+        elif layout == "译文在上":
+            return [
+                (
+                    f"{seg.translated_text}\n{seg.text}"
+                    if seg.translated_text
+                    else seg.text
+                )
+                for seg in segments
+            ]
+        elif layout == "仅译文":
+            return [seg.translated_text or seg.text for seg in segments]
+        # 仅原文及未知布局
+        return [seg.text for seg in segments]
+
     def to_txt(self, save_path=None, layout: str = "原文在上") -> str:
         """Convert to plain text subtitle format (without timestamps)"""
-        result = []
-        for seg in self.segments:
-            # 检查是否有换行符
-            original = seg.text
-            translated = seg.translated_text
-
-            # 根据字幕类型组织文本
-            if layout == "原文在上":
-                text = f"{original}\n{translated}" if translated else original
-            elif layout == "译文在上":
-                text = f"{translated}\n{original}" if translated else original
-            elif layout == "仅原文":
-                text = original
-            elif layout == "仅译文":
-                text = translated if translated else original
-            else:
-                text = seg.transcript
-            result.append(text)
-        text = "\n".join(result)
+        text = "\n".join(self._layout_texts(layout))
         if save_path:
             # 处理Windows长路径问题
             save_path = handle_long_path(save_path)
 
             with open(save_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(result))
+                f.write(text)
         return text
 
     def to_srt(self, layout: str = "原文在上", save_path=None) -> str:
         """Convert to SRT subtitle format"""
-        srt_lines = []
-        for n, seg in enumerate(self.segments, 1):
-            # 检查是否有换行符
-            original = seg.text
-            translated = seg.translated_text
-
-            # 根据字幕类型组织文本
-            if layout == "原文在上":
-                text = f"{original}\n{translated}" if translated else original
-            elif layout == "译文在上":
-                text = f"{translated}\n{original}" if translated else original
-            elif layout == "仅原文":
-                text = original
-            elif layout == "仅译文":
-                text = translated if translated else original
-            else:
-                text = seg.transcript
-
-            srt_lines.append(f"{n}\n{seg.to_srt_ts()}\n{text}\n")
+        srt_lines = [
+            f"{n}\n{seg.to_srt_ts()}\n{text}\n"
+            for n, (seg, text) in enumerate(
+                zip(self.segments, self._layout_texts(layout)), 1
+            )
+        ]
 
         srt_text = "\n".join(srt_lines)
         if save_path:
@@ -328,7 +422,7 @@ class ASRData:
                 "0,0,1,2,0,2,10,10,15,1"
             )
 
-        ass_content = (
+        ass_parts = [
             "[Script Info]\n"
             "; Script generated by VideoCaptioner\n"
             "; https://github.com/weifeng2333\n"
@@ -338,51 +432,54 @@ class ASRData:
             f"{style_str}\n\n"
             "[Events]\n"
             "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
-        )
+        ]
 
         dialogue_template = "Dialogue: 0,{},{},{},,0,0,0,,{}\n"
-        for seg in self.segments:
-            start_time, end_time = seg.to_ass_ts()
-            original = seg.text
-            translated = seg.translated_text
-
-            # 检查是否有译文
-            has_translation = bool(translated and translated.strip())
-
-            if layout == "译文在上":
-                if has_translation:
-                    ass_content += dialogue_template.format(
-                        start_time, end_time, "Secondary", original
-                    )
-                    ass_content += dialogue_template.format(
-                        start_time, end_time, "Default", translated
-                    )
-                else:
-                    ass_content += dialogue_template.format(
-                        start_time, end_time, "Default", original
-                    )
-            elif layout == "原文在上":
-                if has_translation:
-                    ass_content += dialogue_template.format(
-                        start_time, end_time, "Secondary", translated
+        append = ass_parts.append
+        # 布局只判断一次，循环内不再比较字符串
+        if layout in ("译文在上", "原文在上"):
+            original_on_top = layout == "原文在上"
+            for seg in self.segments:
+                start_time, end_time = seg.to_ass_ts()
+                original = seg.text
+                translated = seg.translated_text
+
+                # 检查是否有译文
+                if translated and translated.strip():
+                    if original_on_top:
+                        secondary, default = translated, original
+                    else:
+                        secondary, default = original, translated
+                    append(
+                        dialogue_template.format(
+                            start_time, end_time, "Secondary", secondary
+                        )
                     )
-                    ass_content += dialogue_template.format(
-                        start_time, end_time, "Default", original
+                    append(
+                        dialogue_template.format(
+                            start_time, end_time, "Default", default
+                        )
                     )
                 else:
-                    ass_content += dialogue_template.format(
-                        start_time, end_time, "Default", original
+                    append(
+                        dialogue_template.format(
+                            start_time, end_time, "Default", original
+                        )
                     )
-            elif layout == "仅原文":
-                ass_content += dialogue_template.format(
-                    start_time, end_time, "Default", original
+        elif layout == "仅原文":
+            for seg in self.segments:
+                start_time, end_time = seg.to_ass_ts()
+                append(
+                    dialogue_template.format(start_time, end_time, "Default", seg.text)
                 )
-            elif layout == "仅译文":
-                text = translated if has_translation else original
-                ass_content += dialogue_template.format(
-                    start_time, end_time, "Default", text
-                )
-
+        elif layout == "仅译文":
+            for seg in self.segments:
+                start_time, end_time = seg.to_ass_ts()
+                translated = seg.translated_text
+                text = translated if translated and translated.strip() else seg.text
+                append(dialogue_template.format(start_time, end_time, "Default", text))
+
+        ass_content = "".join(ass_parts)
         if save_path:
             # 处理Windows长路径问题
             save_path = handle_long_path(save_path)
@@ -466,10 +563,8 @@ class ASRData:
         if not self.segments:
             return self
 
-        for i in range(len(self.segments) - 1):
-            current_seg = self.segments[i]
-            next_seg = self.segments[i + 1]
-
+        segments = self.segments
+        for current_seg, next_seg in zip(segments, segments[1:]):
             # 计算时间间隔
             time_gap = next_seg.start_time - current_seg.end_time
 
@@ -503,10 +598,15 @@ class ASRData:
         if not file_path.exists():
             raise FileNotFoundError(f"文件不存在: {file_path}")
 
+        # 只读取一次文件，解码失败时直接对已读入的字节改用GBK解码
+        data = file_path.read_bytes()
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = data.decode("utf-8-sig")
         except UnicodeDecodeError:
-            content = file_path.read_text(encoding="gbk")
+            content = data.decode("gbk")
+        # 与文本模式读取保持一致的换行符转换
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
 
         suffix = file_path.suffix.lower()
 
@@ -523,6 +623,22 @@ class ASRData:
         else:
             raise ValueError(f"不支持的文件格式: {suffix}")
 
+    @staticmethod
+    def from_subtitle_files(
+        file_paths: List[str], max_workers: int = None
+    ) -> List["ASRData"]:
+        """使用多进程并行加载多个字幕文件
+
+        Args:
+            file_paths: 字幕文件路径列表
+            max_workers: 最大进程数，为空则使用CPU核心数
+
+        Returns:
+            List[ASRData]: 与 file_paths 顺序一致的ASRData实例列表
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(ASRData.from_subtitle_file, file_paths))
+
     @staticmethod
     def from_json(json_data: dict) -> "ASRData":
         """从JSON数据创建ASRData实例"""
@@ -547,10 +663,7 @@ class ASRData:
         :return: 解析后的ASRData实例。
         """
         segments = []
-        srt_time_pattern = re.compile(
-            r"(\d{2}):(\d{2}):(\d{1,2})[.,](\d{3})\s-->\s(\d{2}):(\d{2}):(\d{1,2})[.,](\d{3})"
-        )
-        blocks = re.split(r"\n\s*\n", srt_str.strip())
+        blocks = _BLOCK_SPLIT_RE.split(srt_str.strip())
 
         # 如果超过96%的块都超过4行，说明可能包含翻译文本
         blocks_lines_count = [len(block.splitlines()) for block in blocks]
@@ -570,27 +683,22 @@ class ASRData:
             if len(lines) < 3:  # 至少需要3行：序号、时间戳和文本
                 continue
 
-            match = srt_time_pattern.match(lines[1])
+            match = _SRT_TIME_RE.match(lines[1])
             if not match:
                 continue
 
-            time_parts = list(map(int, match.groups()))
-            start_time = sum(
-                [
-                    time_parts[0] * 3600000,
-                    time_parts[1] * 60000,
-                    time_parts[2] * 1000,
-                    time_parts[3],
-                ]
-            )
-            end_time = sum(
-                [
-                    time_parts[4] * 3600000,
-                    time_parts[5] * 60000,
-                    time_parts[6] * 1000,
-                    time_parts[7],
-                ]
-            )
+            (
+                start_h,
+                start_m,
+                start_s,
+                start_ms,
+                end_h,
+                end_m,
+                end_s,
+                end_ms,
+            ) = map(int, match.groups())
+            start_time = start_h * 3600000 + start_m * 60000 + start_s * 1000 + start_ms
+            end_time = end_h * 3600000 + end_m * 60000 + end_s * 1000 + end_ms
 
             if has_translated_subtitle and len(lines) >= 4:
                 text = lines[2]
@@ -618,13 +726,6 @@ class ASRData:
         # 跳过头部元数据
         content = vtt_str.split("\n\n")[2:]
 
-        timestamp_pattern = re.compile(
-            r"(\d{2}):(\d{2}):(\d{2})\.(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})\.(\d{3})"
-        )
-        timestamp_pattern2 = re.compile(
-            r"(\d{2}):(\d{2})\.(\d{3})\s*-->\s*(\d{2}):(\d{2})\.(\d{3})"
-        )
-
         for block in content:
             lines = block.strip().split("\n")
             if len(lines) < 2:
@@ -635,9 +736,9 @@ class ASRData:
                 timestamp_line = lines[1]
             else:
                 timestamp_line = lines[0]
-            match = timestamp_pattern.match(timestamp_line)
+            match = _VTT_TIME_RE.match(timestamp_line)
             if not match:
-                match = timestamp_pattern2.match(timestamp_line)
+                match = _VTT_TIME_RE2.match(timestamp_line)
             if not match:
                 continue
 
@@ -681,8 +782,8 @@ class ASRData:
                 text_line = " ".join(lines[2:])
             else:
                 text_line = " ".join(lines[1:])
-            cleaned_text = re.sub(r"<\d{2}:\d{2}:\d{2}\.\d{3}>", "", text_line)
-            cleaned_text = re.sub(r"</?c>", "", cleaned_text)
+            cleaned_text = _VTT_TS_TAG_RE.sub("", text_line)
+            cleaned_text = _VTT_C_RE.sub("", cleaned_text)
             cleaned_text = cleaned_text.strip()
 
             if cleaned_text and cleaned_text != " ":
@@ -706,8 +807,7 @@ class ASRData:
 
         def split_timestamped_text(text: str) -> List[ASRDataSeg]:
             """分离带时间戳的文本为单词段"""
-            pattern = re.compile(r"<(\d{2}:\d{2}:\d{2}\.\d{3})>([^<]*)")
-            matches = list(pattern.finditer(text))
+            matches = list(_YT_WORD_RE.finditer(text))
             word_segments = []
 
             for i in range(len(matches) - 1):
@@ -724,17 +824,16 @@ class ASRData:
             return word_segments
 
         segments = []
-        blocks = re.split(r"\n\n+", vtt_str.strip())
+        # 多个连续空行切分后会留下以换行开头的块或空块，空块在时间戳匹配时跳过
+        blocks = vtt_str.strip().split("\n\n")
 
-        timestamp_pattern = re.compile(
-            r"(\d{2}):(\d{2}):(\d{2}\.\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}\.\d{3})"
-        )
         for block in blocks:
+            block = block.lstrip("\n")
             lines = block.strip().split("\n")
             if not lines:
                 continue
 
-            match = timestamp_pattern.match(lines[0])
+            match = _YT_TIME_RE.match(lines[0])
             if not match:
                 continue
 
@@ -752,9 +851,9 @@ class ASRData:
             # 获取文本内容
             text = "\n".join(lines)
 
-            timestamp_row = re.search(r"\n(.*?<c>.*?</c>.*)", block)
+            timestamp_row = _YT_TIMESTAMP_ROW_RE.search(block)
             if timestamp_row:
-                text = re.sub(r"<c>|</c>", "", timestamp_row.group(1))
+                text = _VTT_C_RE.sub("", timestamp_row.group(1))
                 block_start_time_string = (
                     f"{match.group(1)}:{match.group(2)}:{match.group(3)}"
                 )
@@ -778,9 +877,6 @@ class ASRData:
         :return: ASRData实例
         """
         segments = []
-        ass_time_pattern = re.compile(
-            r"Dialogue: \d+,(\d+:\d{2}:\d{2}\.\d{2}),(\d+:\d{2}:\d{2}\.\d{2}),(.*?),.*?,\d+,\d+,\d+,.*?,(.*?)$"
-        )
 
         def parse_ass_time(time_str: str) -> int:
             """将ASS时间戳转换为毫秒"""
@@ -802,14 +898,15 @@ class ASRData:
         # 按行处理ASS文件
         for line in ass_str.splitlines():
             if line.startswith("Dialogue:"):
-                match = ass_time_pattern.match(line)
+                match = _ASS_LINE_RE.match(line)
                 if match:
                     start_time = parse_ass_time(match.group(1))
                     end_time = parse_ass_time(match.group(2))
                     style = match.group(3).strip()
                     text = match.group(4)
 
-                    text = re.sub(r"\{[^}]*\}", "", text)
+                    if "{" in text:
+                        text = _ASS_BRACE_RE.sub("", text)
                     text = text.replace("\\N", "\n")
                     text = text.strip()
 
@@ -819,15 +916,15 @@ class ASRData:
                     if has_translation:
                         # 使用时间戳作为键
                         time_key = f"{start_time}-{end_time}"
-                        if time_key in temp_segments:
+                        # 取出并清除临时存储中相同时间戳的字幕
+                        existing = temp_segments.pop(time_key, None)
+                        if existing is not None:
                             # 如果已存在相同时间戳的字幕，合并原文和译文
                             if style == "Default":
-                                temp_segments[time_key].translated_text = text
+                                existing.translated_text = text
                             else:
-                                temp_segments[time_key].text = text
-                            # 创建新的字幕段并清除临时存储
-                            segments.append(temp_segments[time_key])
-                            del temp_segments[time_key]
+                                existing.text = text
+                            segments.append(existing)
                         else:
                             # 创建新的字幕段并存储
                             segment = ASRDataSeg(